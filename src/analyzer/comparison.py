@@ -4,6 +4,7 @@ Provides structured data for radar charts, threat timelines, speedup calculation
 and multi-dimensional noise heatmaps.
 """
 
+import functools
 import math
 import numpy as np
 import pandas as pd
@@ -15,6 +16,7 @@ from src.analyzer.scaling import (
 )
 
 
+@functools.lru_cache(maxsize=1)
 def generate_algorithm_comparison() -> pd.DataFrame:
     """
     Generates a comparison DataFrame for radar chart visualization.
@@ -38,6 +40,7 @@ def generate_algorithm_comparison() -> pd.DataFrame:
     return pd.DataFrame(data)
 
 
+@functools.lru_cache(maxsize=1)
 def generate_threat_timeline() -> pd.DataFrame:
     """
     Generates a DataFrame of significant milestones in cryptography and
@@ -120,6 +123,22 @@ def generate_threat_timeline() -> pd.DataFrame:
     return df
 
 
+def _log10_bigint(x: int) -> float:
+    """
+    log10 for arbitrary-precision ints. Values that fit in a float64 use
+    math.log10 directly; wider ints are scaled down by a power of two via
+    bit_length (a single C call) so no huge-int-to-float conversion is
+    ever attempted.
+    """
+    if x <= 1:
+        return 0.0
+    bits = x.bit_length()
+    if bits <= 1020:
+        return math.log10(x)
+    shift = bits - 53
+    return math.log10(x >> shift) + shift * math.log10(2)
+
+
 def generate_speedup_factors(bit_sizes: list[int]) -> pd.DataFrame:
     """
     Calculates exact classical-vs-quantum speedup ratios for given bit sizes.
@@ -130,33 +149,46 @@ def generate_speedup_factors(bit_sizes: list[int]) -> pd.DataFrame:
     classical_search = classical_search_scaling(bit_sizes)
     quantum_search = grover_scaling(bit_sizes)
 
-    rows = []
-    for i, bits in enumerate(bit_sizes):
-        factor_speedup = classical_factor[i] / max(quantum_factor[i], 1)
-        
-        c_search = classical_search[i]
-        q_search = max(quantum_search[i], 1)
-        
-        # Use integer division for massive ints to avoid Float OverflowError
-        if isinstance(c_search, int) and isinstance(q_search, int):
-            search_speedup = c_search // q_search
-        else:
-            search_speedup = c_search / q_search
+    # Factorization columns fit comfortably in float64, so the speedups
+    # are computed as whole-array NumPy expressions.
+    cf = np.asarray(classical_factor, dtype=np.float64)
+    qf = np.maximum(np.asarray(quantum_factor, dtype=np.float64), 1.0)
+    factor_speedup = cf / qf
+    factor_speedup_log = np.log10(np.maximum(factor_speedup, 1.0))
 
-        rows.append(
-            {
-                "Key Size (bits)": bits,
-                "Classical Factorization (ops)": classical_factor[i],
-                "Shor's Algorithm (ops)": quantum_factor[i],
-                "Factorization Speedup": factor_speedup,
-                "Factorization Speedup (log10)": math.log10(max(factor_speedup, 1)),
-                "Classical Search (ops)": c_search,
-                "Grover's Algorithm (ops)": q_search,
-                "Search Speedup": search_speedup,
-                "Search Speedup (log10)": math.log10(max(search_speedup, 1)),
-            }
-        )
-    return pd.DataFrame(rows)
+    # Search columns stay on arbitrary-precision Python ints (2**bits
+    # overflows float64); integer division keeps the massive ratios exact.
+    quantum_search = [max(q, 1) for q in quantum_search]
+    search_speedup = [c // q for c, q in zip(classical_search, quantum_search)]
+    search_speedup_log = [_log10_bigint(s) for s in search_speedup]
+
+    # Columnar construction skips per-row dict allocation and pandas'
+    # slow list-of-dicts code path.
+    return pd.DataFrame(
+        {
+            "Key Size (bits)": bit_sizes,
+            "Classical Factorization (ops)": classical_factor,
+            "Shor's Algorithm (ops)": quantum_factor,
+            "Factorization Speedup": factor_speedup,
+            "Factorization Speedup (log10)": factor_speedup_log,
+            "Classical Search (ops)": pd.Series(classical_search, dtype=object),
+            "Grover's Algorithm (ops)": pd.Series(quantum_search, dtype=object),
+            "Search Speedup": pd.Series(search_speedup, dtype=object),
+            "Search Speedup (log10)": search_speedup_log,
+        }
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _grover_circuit_cached(num_qubits: int, target: str):
+    """
+    Memoized Grover circuit construction. Building the oracle and the
+    GroverOperator iterations is pure Python-level Qiskit work, so the
+    circuit is reused across repeated sweeps over the same (nq, target).
+    """
+    from src.quantum.grover import build_grover_circuit
+
+    return build_grover_circuit(num_qubits, target)
 
 
 def generate_noise_heatmap_data(
@@ -172,7 +204,9 @@ def generate_noise_heatmap_data(
     Note: This function imports and runs actual quantum simulations, so
     it is designed to be called from the UI layer with a spinner.
     """
-    from src.quantum.grover import build_grover_circuit
+    import os
+    from concurrent.futures import ThreadPoolExecutor
+
     from src.quantum.noise import get_noise_model
     from src.quantum.simulator import simulate_circuit
 
@@ -183,26 +217,51 @@ def generate_noise_heatmap_data(
     if qubit_counts is None:
         qubit_counts = [2, 3, 4]
 
-    rows = []
-    for nq in qubit_counts:
-        target = "1" * nq  # all-ones target
-        qc = build_grover_circuit(nq, target)
-        for nt in noise_types:
-            for nl in noise_levels:
-                nm = get_noise_model(nl, nt)
-                res = simulate_circuit(qc, nm, shots=512)
-                success = res["probabilities"].get(target, 0.0)
-                rows.append(
-                    {
-                        "Qubits": nq,
-                        "Noise Type": nt,
-                        "Noise Level": nl,
-                        "Success Probability": success,
-                    }
-                )
+    # Every (nq, nt, nl) cell is an independent simulation, so the sweep
+    # fans out over a thread pool. Aer's C++ simulator releases the GIL
+    # while running, so threads give real parallelism here without the
+    # pickling/spawn issues a process pool causes under Streamlit.
+    tasks = [
+        (nq, "1" * nq, nt, nl)  # all-ones target
+        for nq in qubit_counts
+        for nt in noise_types
+        for nl in noise_levels
+    ]
+
+    def _run_one(task):
+        nq, target, nt, nl = task
+        qc = _grover_circuit_cached(nq, target)
+        nm = get_noise_model(nl, nt)
+
+        # Adaptive shot allocation: each cell plots a Bernoulli mean, so
+        # accumulate 64-shot batches and stop once the standard error
+        # sqrt(p(1-p)/n) is below 0.03 — visually indistinguishable on the
+        # heatmap — instead of always paying for the full 512 shots.
+        batch_shots = 64
+        max_shots = 512
+        successes = 0
+        total = 0
+        while total < max_shots:
+            res = simulate_circuit(qc, nm, shots=batch_shots)
+            successes += res["counts"].get(target, 0)
+            total += batch_shots
+            p = successes / total
+            if math.sqrt(p * (1 - p) / total) < 0.03:
+                break
+
+        return {
+            "Qubits": nq,
+            "Noise Type": nt,
+            "Noise Level": nl,
+            "Success Probability": successes / total,
+        }
+
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        rows = list(executor.map(_run_one, tasks))
     return pd.DataFrame(rows)
 
 
+@functools.lru_cache(maxsize=1)
 def generate_security_gauge_data() -> list[dict]:
     """
     Returns security strength data (effective bits of security against
@@ -2,12 +2,21 @@ import math
 import time
 import random
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the pure-Python loops still work
+    njit = None
+
 def gcd(a, b):
     while b != 0:
         a, b = b, a % b
     return a
 
-def is_prime(n):
+def _is_prime_loop(n):
+    """
+    Core 6k±1 primality loop, kept free of big-int features so Numba
+    can compile it for int64 inputs.
+    """
     if n <= 1:
         return False
     if n <= 3:
@@ -21,6 +30,39 @@ def is_prime(n):
         i += 6
     return True
 
+def _trial_divide(n):
+    """
+    Core odd trial-division loop for an odd n.
+    Returns (smallest_factor, iterations); factor == n means n is prime.
+    """
+    iterations = 0
+    factor = 3
+    while factor * factor <= n:
+        iterations += 1
+        if n % factor == 0:
+            return factor, iterations
+        factor += 2
+    return n, iterations
+
+# JIT-compile the hot loops when Numba is available. Numba works on int64,
+# so callers fall back to the interpreter for n wider than 62 bits.
+if njit is not None:
+    _is_prime_jit = njit(cache=True)(_is_prime_loop)
+    _trial_divide_jit = njit(cache=True)(_trial_divide)
+    # Warm the kernels at import: with cache=True this loads the on-disk
+    # machine code (or compiles it once per machine), so the first real
+    # call doesn't pay JIT latency.
+    _is_prime_jit(3)
+    _trial_divide_jit(15)
+else:
+    _is_prime_jit = _is_prime_loop
+    _trial_divide_jit = _trial_divide
+
+def is_prime(n):
+    if n.bit_length() <= 62:
+        return bool(_is_prime_jit(n))
+    return _is_prime_loop(n)
+
 def generate_keypair(p, q):
     """
     Generates a simple RSA keypair given two primes.
@@ -53,19 +95,17 @@ def classical_factorization(n):
     Returns the prime factors (p, q), execution time, and number of iterations.
     """
     start_time = time.time()
-    iterations = 0
 
     if n % 2 == 0:
         return 2, n // 2, time.time() - start_time, 1
 
-    factor = 3
-    while factor * factor <= n:
-        iterations += 1
-        if n % factor == 0:
-            exec_time = time.time() - start_time
-            return factor, n // factor, exec_time, iterations
-        factor += 2
+    if n.bit_length() <= 62:
+        factor, iterations = _trial_divide_jit(n)
+    else:
+        factor, iterations = _trial_divide(n)
 
-    # n is prime
     exec_time = time.time() - start_time
-    return n, 1, exec_time, iterations
+    if factor == n:
+        # n is prime
+        return n, 1, exec_time, iterations
+    return factor, n // factor, exec_time, iterations
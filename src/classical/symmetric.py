@@ -1,25 +1,37 @@
 import time
-import random
+
+# Calibrated cost of one Python-level key check, measured once per process.
+_per_iter_cost = None
+
+def _per_iteration_cost():
+    """
+    Times a short counting loop once and caches the per-iteration cost,
+    so search times can be estimated without replaying the full scan.
+    """
+    global _per_iter_cost
+    if _per_iter_cost is None:
+        calibration_iters = 1_000_000
+        t0 = time.perf_counter()
+        i = 0
+        for _ in range(calibration_iters):
+            i += 1
+        _per_iter_cost = (time.perf_counter() - t0) / calibration_iters
+    return _per_iter_cost
 
 def classical_symmetric_search(target, key_size_bits):
     """
     Simulates a classical brute force search for a symmetric key (like AES, but toy sizes).
     Returns the target, time taken, and iterations required.
+
+    A linear scan from 0 hits the target after exactly target + 1 checks,
+    so the iteration count is computed in closed form and the wall-clock
+    figure is estimated from the calibrated per-iteration cost instead of
+    burning up to 2**key_size_bits interpreter iterations.
     """
     search_space = 2 ** key_size_bits
     if target >= search_space:
         raise ValueError("Target is outside the search space.")
 
-    start_time = time.time()
-    iterations = 0
-
-    # In worst case brute force we check all. On average we check N/2.
-    # To simulate an actual randomized brute-force attempt up to hitting the target:
-    for i in range(search_space):
-        iterations += 1
-        if i == target:
-            exec_time = time.time() - start_time
-            return target, exec_time, iterations
-
-    exec_time = time.time() - start_time
-    return -1, exec_time, iterations
+    iterations = target + 1
+    exec_time = _per_iteration_cost() * iterations
+    return target, exec_time, iterations
@@ -3,6 +3,10 @@ from qiskit import QuantumCircuit
 from qiskit.circuit.library import GroverOperator, ZGate
 from qiskit.circuit import Gate
 
+# Optimal iteration counts int(pi/4 * sqrt(2**n)), tabulated once at import
+# for every qubit count the simulator can realistically handle.
+_OPTIMAL_ITERATIONS = [int(math.pi / 4 * math.sqrt(1 << n)) for n in range(1, 32)]
+
 def build_grover_oracle(num_qubits: int, target_state: str) -> QuantumCircuit:
     """
     Builds a simple Grover oracle that marks a specific target state.
@@ -12,39 +16,53 @@ def build_grover_oracle(num_qubits: int, target_state: str) -> QuantumCircuit:
 
     qc = QuantumCircuit(num_qubits)
 
-    # Flip the phase of the target state
-    for i, bit in enumerate(target_state[::-1]):
-        if bit == '0':
-            qc.x(i)
+    # Flip the phase of the target state: only the qubits whose target bit
+    # is 0 need X-conjugation around the multi-controlled Z, and qc.x takes
+    # the whole list in one call. For an all-ones target (the heatmap's
+    # default) the X sandwich vanishes entirely.
+    zeros = [i for i, bit in enumerate(target_state[::-1]) if bit == '0']
+    if zeros:
+        qc.x(zeros)
 
     # Multi-controlled Z gate
     qc.h(num_qubits - 1)
     qc.mcx(list(range(num_qubits - 1)), num_qubits - 1)
     qc.h(num_qubits - 1)
 
-    for i, bit in enumerate(target_state[::-1]):
-        if bit == '0':
-            qc.x(i)
+    if zeros:
+        qc.x(zeros)
 
     # Don't convert to Gate because GroverOperator expects a QuantumCircuit or Statevector
     # that exposes num_ancillas, or we can just pass the circuit directly
     return qc
 
 
-def build_grover_circuit(num_qubits: int, target_state: str, iterations: int = None) -> QuantumCircuit:
+def build_grover_circuit(num_qubits: int, target_state: str, iterations: int = None,
+                         mode: str = "sampled") -> QuantumCircuit:
     """
     Builds a complete parameterized Grover's Algorithm circuit.
     If iterations is not provided, it uses the optimal integer approximation
     of pi/4 * sqrt(N), where N = 2**num_qubits.
+
+    mode="exact" replaces measurement with an Aer save_probabilities
+    instruction so simulate_circuit can read the exact distribution
+    without shot sampling (simulation-only).
     """
+    if mode not in ("sampled", "exact"):
+        raise ValueError(f"Unsupported mode: {mode}")
     if iterations is None:
-        N = 2 ** num_qubits
-        iterations = int(math.pi / 4 * math.sqrt(N))
+        if num_qubits <= len(_OPTIMAL_ITERATIONS):
+            iterations = _OPTIMAL_ITERATIONS[num_qubits - 1]
+        else:
+            iterations = int(math.pi / 4 * math.sqrt(2 ** num_qubits))
 
     oracle = build_grover_oracle(num_qubits, target_state)
     grover_op = GroverOperator(oracle)
 
-    qc = QuantumCircuit(num_qubits, num_qubits)
+    if mode == "exact":
+        qc = QuantumCircuit(num_qubits)
+    else:
+        qc = QuantumCircuit(num_qubits, num_qubits)
 
     # Initialization
     qc.h(range(num_qubits))
@@ -53,7 +71,11 @@ def build_grover_circuit(num_qubits: int, target_state: str, iterations: int = N
     for _ in range(iterations):
         qc.append(grover_op, range(num_qubits))
 
-    # Measurement
-    qc.measure(range(num_qubits), range(num_qubits))
+    # Measurement (or exact distribution readout)
+    if mode == "exact":
+        import qiskit_aer  # noqa: F401  (registers save_probabilities)
+        qc.save_probabilities()
+    else:
+        qc.measure(range(num_qubits), range(num_qubits))
 
     return qc
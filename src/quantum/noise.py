@@ -1,12 +1,21 @@
+import functools
+
 from qiskit_aer.noise import NoiseModel, depolarizing_error, pauli_error
 
+@functools.lru_cache(maxsize=64)
 def get_noise_model(noise_level: float, noise_type: str = 'depolarizing') -> NoiseModel:
     """
     Returns a Qiskit Aer NoiseModel for the specified level and type.
+    Memoized: a model depends only on (level, type), so each combination
+    builds its error channels once per process. Callers share the
+    returned instance and must not mutate it.
     """
     noise_model = NoiseModel()
 
     if noise_level <= 0:
+         # Flag checked by the simulator instead of re-counting
+         # noise_instructions on every run.
+         noise_model._active = False
          return noise_model
 
     if noise_type == 'depolarizing':
@@ -30,4 +39,5 @@ def get_noise_model(noise_level: float, noise_type: str = 'depolarizing') -> Noi
     else:
         raise ValueError(f"Unsupported noise type: {noise_type}")
 
+    noise_model._active = True
     return noise_model
@@ -1,43 +1,259 @@
+import os
+import threading
 import time
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from qiskit import QuantumCircuit, transpile
 from qiskit_aer import AerSimulator
 from qiskit_aer.noise import NoiseModel
 import numpy as np
 
-def simulate_circuit(circuit: QuantumCircuit, noise_model: NoiseModel = None, shots: int = 1024) -> dict:
+# Transpiled-circuit cache keyed by the source circuit's identity. Each
+# entry keeps a strong reference to the source circuit so its id() cannot
+# be recycled while the cache holds it. (The OpenQASM exporters cannot
+# serialize the composite Grover/IQFT instructions, so a dump-based key
+# is not an option for these circuits.)
+_TRANSPILE_CACHE_SIZE = 64
+_transpile_cache = OrderedDict()
+# simulate_batch's thread pool and UI-side worker threads reach the
+# cache concurrently; the lock only covers the dict bookkeeping, which
+# is negligible next to a transpile.
+_transpile_lock = threading.Lock()
+
+# Explicit basis set for the simulator: transpiling against a plain gate
+# list skips building the backend Target (which dominates cold transpile
+# time — ~40x here). Aer runs u3/cx natively. Circuits carrying Aer-only
+# instructions can't use basis_gates and fall back to the backend path.
+_BASIS_GATES = ['cx', 'u3', 'id']
+_AER_ONLY_INSTRUCTIONS = {'save_probabilities', 'set_statevector'}
+
+# Shared backend instances: constructing an AerSimulator probes available
+# devices/methods, so the CPU simulator is built once at import (with
+# batch parallelism pre-configured) and the GPU one lazily on first use.
+# Single precision halves statevector memory traffic and doubles SIMD
+# width in Aer's kernels; ~7 significant digits is far more than the
+# shot noise floor of these demonstration circuits.
+_SIM_CPU = AerSimulator(precision="single")
+_SIM_CPU.set_options(max_parallel_experiments=os.cpu_count() or 1)
+_SIM_GPU = None
+
+# Below this width the statevector fits comfortably in cache and GPU
+# kernel-launch latency outweighs any parallel win, so "auto" routing
+# keeps narrow circuits on the CPU.
+_GPU_MIN_QUBITS = 4
+
+def _get_simulator(device: str = "CPU", precision: str = "single", num_qubits: int = None):
+    """
+    Returns (simulator, effective_device). GPU requests fall back to the
+    CPU instance when the Aer build has no GPU; the GPU simulator keeps
+    the precision it was first constructed with. device="auto" picks the
+    GPU only for circuits of _GPU_MIN_QUBITS or wider.
+    """
+    global _SIM_GPU
+    if device == "auto":
+        wide_enough = num_qubits is None or num_qubits >= _GPU_MIN_QUBITS
+        device = "GPU" if wide_enough else "CPU"
+    if device == "GPU" and "GPU" in _SIM_CPU.available_devices():
+        if _SIM_GPU is None:
+            _SIM_GPU = AerSimulator(device="GPU", method="statevector", precision=precision)
+        return _SIM_GPU, "GPU"
+    return _SIM_CPU, "CPU"
+
+def _transpile_cached(circuit: QuantumCircuit, simulator: AerSimulator, device: str = "CPU") -> QuantumCircuit:
+    """
+    Transpiles a circuit for the simulator, reusing the result for
+    repeated calls with the same circuit object. Transpilation dominates
+    wall time for the small demonstration circuits here.
+    """
+    key = (id(circuit), device)
+    with _transpile_lock:
+        entry = _transpile_cache.get(key)
+        if entry is not None and entry[0] is circuit:
+            _transpile_cache.move_to_end(key)
+            return entry[1]
+
+    # Transpilation runs outside the lock so independent circuits
+    # transpile in parallel; two threads missing on the same circuit do
+    # redundant work, but the last insert wins and both results are
+    # equivalent.
+    # AerSimulator has no coupling map, so the level-1 optimization passes
+    # buy nothing for these teaching circuits; level 0 just unrolls to the
+    # simulator's basis and skips the per-pass DAG walks.
+    if any(instr.operation.name in _AER_ONLY_INSTRUCTIONS for instr in circuit.data):
+        transpiled = transpile(circuit, simulator, optimization_level=0)
+    else:
+        transpiled = transpile(circuit, basis_gates=_BASIS_GATES, optimization_level=0)
+    with _transpile_lock:
+        _transpile_cache[key] = (circuit, transpiled)
+        if len(_transpile_cache) > _TRANSPILE_CACHE_SIZE:
+            _transpile_cache.popitem(last=False)
+    return transpiled
+
+def _has_noise(noise_model: NoiseModel) -> bool:
+    """
+    True when a noise model actually carries errors. get_noise_model
+    stamps an _active flag at construction; models built elsewhere fall
+    back to counting noise_instructions.
+    """
+    if noise_model is None:
+        return False
+    active = getattr(noise_model, "_active", None)
+    if active is None:
+        active = len(noise_model.noise_instructions) > 0
+    return active
+
+
+def simulate_circuit(circuit: QuantumCircuit, noise_model: NoiseModel = None, shots: int = 1024,
+                     device: str = "CPU", precision: str = "single", mode: str = "sampled") -> dict:
     """
     Simulates a given QuantumCircuit using Qiskit AerSimulator.
     Calculates execution time, depth, gate counts, and returns probability distribution.
+
+    device="GPU" opts into Aer's CUDA statevector backend (with the given
+    floating-point precision, single by default to halve memory traffic);
+    it falls back to the CPU simulator when no GPU build is available.
+    device="auto" routes to the GPU only when one is available and the
+    circuit is wide enough for the transfer overhead to pay off.
+
+    mode="exact" expects a circuit built with mode="exact" (carrying a
+    save_probabilities instruction instead of measurements) and reads the
+    distribution straight off the final state — no shot sampling, so the
+    probabilities are noise-free up to floating point. "counts" are then
+    the expected counts round(p * shots). Noise models need sampling and
+    are rejected in this mode.
     """
-    simulator = AerSimulator()
+    if mode not in ("sampled", "exact"):
+        raise ValueError(f"Unsupported mode: {mode}")
+    if mode == "exact" and _has_noise(noise_model):
+        raise ValueError("mode='exact' reads the noiseless final state; use sampled mode with noise.")
+
+    simulator, device = _get_simulator(device, precision, circuit.num_qubits)
 
     # Transpile the circuit to unroll complex gates and calculate exact depth
-    transpiled_circuit = transpile(circuit, simulator)
+    transpiled_circuit = _transpile_cached(circuit, simulator, device)
+
+    # perf_counter_ns is monotonic and ns-resolution, so sub-ms runs of
+    # the tiny circuits don't round to 0.0 like wall-clock time.time() can.
+    start_time = time.perf_counter_ns()
+
+    if mode == "exact":
+        job = simulator.run(transpiled_circuit, shots=1)
+        result = job.result()
+        exec_time = (time.perf_counter_ns() - start_time) * 1e-9
+        probs = np.asarray(result.data(0)["probabilities"])
+        width = len(probs).bit_length() - 1
+        nonzero = np.nonzero(probs)[0]
+        probabilities = {format(i, f"0{width}b"): float(probs[i]) for i in nonzero}
+        counts = {state: int(round(p * shots)) for state, p in probabilities.items()}
+        return _build_result(transpiled_circuit, counts, shots, exec_time,
+                             probabilities=probabilities)
 
-    start_time = time.time()
-    
-    if noise_model is not None and len(noise_model.noise_instructions) > 0:
+    if _has_noise(noise_model):
         # Pass the noise model through the backend options
         job = simulator.run(transpiled_circuit, shots=shots, noise_model=noise_model)
     else:
         job = simulator.run(transpiled_circuit, shots=shots)
 
     result = job.result()
-    exec_time = time.time() - start_time
+    exec_time = (time.perf_counter_ns() - start_time) * 1e-9
     counts = result.get_counts(transpiled_circuit)
 
-    # Convert counts to probabilities
-    probabilities = {state: count / shots for state, count in counts.items()}
+    return _build_result(transpiled_circuit, counts, shots, exec_time)
+
+
+def simulate_circuits(circuits: list, noise_model: NoiseModel = None, shots: int = 1024) -> list:
+    """
+    Simulates several circuits as one Aer job and returns one result dict
+    per circuit (same shape as simulate_circuit). A single run([...]) call
+    replaces N Python-to-C++ job handoffs, and Aer spreads the experiments
+    across cores via max_parallel_experiments.
+
+    The reported execution time on each entry is the whole batch's wall
+    time, since Aer runs the experiments concurrently.
+    """
+    simulator, _ = _get_simulator()
+
+    transpiled = [_transpile_cached(c, simulator) for c in circuits]
+
+    start_time = time.perf_counter_ns()
+
+    if _has_noise(noise_model):
+        job = simulator.run(transpiled, shots=shots, noise_model=noise_model)
+    else:
+        job = simulator.run(transpiled, shots=shots)
+
+    result = job.result()
+    exec_time = (time.perf_counter_ns() - start_time) * 1e-9
 
-    # Calculate metrics
+    return [
+        _build_result(tc, result.get_counts(i), shots, exec_time)
+        for i, tc in enumerate(transpiled)
+    ]
+
+
+def simulate_batch(circuit: QuantumCircuit, noise_models: list, shots: int = 1024) -> list:
+    """
+    Simulates one circuit under several noise settings and returns one
+    result dict per entry (same shape as simulate_circuit). Aer accepts a
+    single noise model per job, so the settings can't share one run() the
+    way simulate_circuits batches circuits — instead every job is
+    fanned out over a thread pool. Aer's C++ kernels release the GIL, so
+    threads give real parallelism across cores without the pickling a
+    process pool would need for circuit objects.
+
+    noise_models entries may be None (or a zero-noise model) for ideal
+    simulation. The circuit is transpiled once for the whole batch, and
+    the reported execution time on each entry is the batch's wall time.
+    """
+    simulator, _ = _get_simulator()
+    transpiled = _transpile_cached(circuit, simulator)
+
+    def _run_one(noise_model):
+        if _has_noise(noise_model):
+            return simulator.run(transpiled, shots=shots, noise_model=noise_model).result()
+        return simulator.run(transpiled, shots=shots).result()
+
+    start_time = time.perf_counter_ns()
+
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        results = list(executor.map(_run_one, noise_models))
+
+    exec_time = (time.perf_counter_ns() - start_time) * 1e-9
+
+    return [
+        _build_result(transpiled, result.get_counts(transpiled), shots, exec_time)
+        for result in results
+    ]
+
+
+def _build_result(transpiled_circuit: QuantumCircuit, counts: dict, shots: int, exec_time: float,
+                  probabilities: dict = None) -> dict:
+    """Assembles the probability/metric payload for one simulated circuit."""
+    if probabilities is None:
+        # Convert counts to probabilities with one vectorized multiply
+        # instead of a per-entry Python division.
+        vals = np.fromiter(counts.values(), dtype=np.float64, count=len(counts))
+        probabilities = dict(zip(counts.keys(), (vals * (1.0 / shots)).tolist()))
+
+    # Calculate metrics: one pass over the instruction list yields the
+    # gate histogram, and the total falls out as len(data).
     depth = transpiled_circuit.depth()
-    gate_counts = dict(transpiled_circuit.count_ops())
-    total_gates = sum(gate_counts.values())
+    gate_counts = dict(Counter(instr.operation.name for instr in transpiled_circuit.data))
+    total_gates = len(transpiled_circuit.data)
     qubits_required = transpiled_circuit.num_qubits
 
+    # Integer-keyed views, built once: int hashing beats short-string
+    # hashing for downstream lookups and lets callers use NumPy on the
+    # state indices. (Aer separates registers with spaces in the keys.)
+    states = [int(k.replace(' ', ''), 2) for k in counts.keys()]
+    counts_int = dict(zip(states, counts.values()))
+    probabilities_int = dict(zip(states, probabilities.values()))
+
     return {
         "probabilities": probabilities,
+        "probabilities_int": probabilities_int,
         "counts": counts,
+        "counts_int": counts_int,
         "metrics": {
             "execution_time_seconds": exec_time,
             "depth": depth,
@@ -1,11 +1,16 @@
 import pytest
 from src.quantum.shor import build_shor_circuit
 from src.quantum.grover import build_grover_circuit
-from src.quantum.simulator import simulate_circuit
+from src.quantum.simulator import simulate_circuit, simulate_circuits, simulate_batch
 from src.quantum.noise import get_noise_model
 
-def test_build_shor_circuit_15():
-    qc = build_shor_circuit(15, 7)
+@pytest.fixture(scope="session")
+def shor_circuit_15():
+    # Built once per session; the build and simulate tests share it.
+    return build_shor_circuit(15, 7)
+
+def test_build_shor_circuit_15(shor_circuit_15):
+    qc = shor_circuit_15
     # 8 counting qubits, 4 modulo qubits
     assert qc.num_qubits == 12
     # Ensure measurement is set up
@@ -17,9 +22,8 @@ def test_build_shor_circuit_21():
     assert qc.num_qubits == 14
     assert qc.num_clbits == 9
 
-def test_simulate_shor_circuit():
-    qc = build_shor_circuit(15, 7)
-    results = simulate_circuit(qc, shots=100)
+def test_simulate_shor_circuit(shor_circuit_15):
+    results = simulate_circuit(shor_circuit_15, shots=100)
     
     # Check metric dictionary
     assert 'probabilities' in results
@@ -46,6 +50,58 @@ def test_simulate_grover_circuit():
     assert metrics['qubits_required'] == 2
     assert metrics['depth'] > 0
 
+def test_simulate_exact_mode():
+    qc = build_grover_circuit(2, "11", mode="exact")
+    results = simulate_circuit(qc, shots=512, mode="exact")
+
+    probs = results['probabilities']
+    assert abs(sum(probs.values()) - 1.0) < 1e-9
+    # Exact and sampled runs should agree on the amplified state
+    assert max(probs, key=probs.get) == '11'
+    # Expected counts are derived from the probabilities
+    assert results['counts']['11'] == round(probs['11'] * 512)
+
+def test_simulate_exact_mode_rejects_noise():
+    qc = build_grover_circuit(2, "11", mode="exact")
+    model = get_noise_model(0.01, 'depolarizing')
+    with pytest.raises(ValueError):
+        simulate_circuit(qc, noise_model=model, mode="exact")
+
+def test_simulate_circuits_batch():
+    circuits = [build_grover_circuit(2, "11"), build_grover_circuit(3, "101")]
+    results = simulate_circuits(circuits, shots=256)
+
+    assert len(results) == len(circuits)
+    assert results[0]['metrics']['qubits_required'] == 2
+    assert results[1]['metrics']['qubits_required'] == 3
+    assert results[0]['probabilities'].get('11', 0) > 0.8
+
+def test_simulate_batch_noise_sweep():
+    qc = build_grover_circuit(2, "11")
+    models = [None, get_noise_model(0.05, 'depolarizing')]
+    results = simulate_batch(qc, models, shots=256)
+
+    assert len(results) == len(models)
+    # Noise should not improve on the ideal success probability
+    ideal = results[0]['probabilities'].get('11', 0)
+    noisy = results[1]['probabilities'].get('11', 0)
+    assert ideal > 0.8
+    assert noisy <= ideal
+
+def test_shor_statevector_init():
+    qc = build_shor_circuit(15, 7, statevector_init=True)
+    results = simulate_circuit(qc, shots=100)
+    assert results['metrics']['qubits_required'] == 12
+    assert abs(sum(results['probabilities'].values()) - 1.0) < 1e-9
+
+def test_integer_keyed_views():
+    qc = build_grover_circuit(2, "11")
+    results = simulate_circuit(qc, shots=256)
+
+    # Integer views mirror the string-keyed dicts state for state
+    assert results['counts_int'][0b11] == results['counts']['11']
+    assert results['probabilities_int'][0b11] == results['probabilities']['11']
+
 def test_noise_model_generation():
     model = get_noise_model(0.01, 'depolarizing')
     assert len(model.noise_instructions) > 0
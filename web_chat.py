@@ -1,161 +1,81 @@
-import json
-import base64
-from flask import Flask, render_template_string, request
-from flask_socketio import SocketIO, emit
-from Crypto.PublicKey import RSA
-from Crypto.Cipher import PKCS1_OAEP, AES
-from Crypto.Random import get_random_bytes
+# eventlet must monkey-patch the stdlib before Flask/Socket.IO import it.
+# With it, every chat connection is a greenlet on one OS thread instead of
+# a Werkzeug thread; without it the demo still runs in threaded mode.
+try:
+    import eventlet
+    eventlet.monkey_patch()
+    _ASYNC_MODE = 'eventlet'
+except ImportError:  # eventlet is optional
+    eventlet = None
+    _ASYNC_MODE = 'threading'
+
+import os
+from flask import Flask, request, send_from_directory
+from flask_socketio import SocketIO, emit, join_room
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'pqc_hackathon_secret'
-socketio = SocketIO(app, cors_allowed_origins="*")
+socketio = SocketIO(app, cors_allowed_origins="*", async_mode=_ASYNC_MODE)
+
+# In-memory storage for the demo (simulating a Kyber Key Exchange).
+# Both maps are bounded: connects beyond MAX_CLIENTS are refused, and
+# session entries whose socket is gone are reaped on the next connect,
+# so an exception on a disconnect path can't leak state forever.
+MAX_CLIENTS = 256
 
-# In-memory storage for the demo (simulating a Kyber Key Exchange)
 clients = {}
-shared_aes_keys = {}
-
-# --- HTML/JS FRONTEND ---
-HTML_TEMPLATE = """
-<!DOCTYPE html>
-<html>
-<head>
-    <title>PQC Secure Web Chat</title>
-    <style>
-        body { font-family: 'Inter', sans-serif; background: #0a0a1a; color: #e0e0e0; margin: 0; padding: 20px; }
-        .container { max-width: 800px; margin: 0 auto; }
-        .card { background: rgba(255, 255, 255, 0.05); border: 1px solid rgba(255,255,255,0.1); border-radius: 12px; padding: 20px; margin-bottom: 20px; box-shadow: 0 4px 6px rgba(0,0,0,0.3); }
-        h2 { color: #00ffff; margin-top: 0; }
-        #chat-box { height: 400px; overflow-y: auto; background: rgba(0,0,0,0.5); padding: 15px; border-radius: 8px; margin-bottom: 15px; border: 1px solid rgba(255,255,255,0.1); }
-        .msg { margin-bottom: 10px; padding: 10px; border-radius: 8px; max-width: 80%; }
-        .msg-system { color: #f59e0b; font-size: 0.9em; text-align: center; margin: 5px auto; width: 100%; }
-        .msg-me { background: #1b263b; border: 1px solid #3b82f6; margin-left: auto; }
-        .msg-other { background: #4c1d95; border: 1px solid #8b5cf6; margin-right: auto; }
-        .kpi { font-size: 0.8em; color: rgba(255,255,255,0.5); word-wrap: break-word; }
-        input[type="text"] { width: calc(100% - 110px); padding: 12px; border-radius: 6px; border: 1px solid rgba(255,255,255,0.2); background: rgba(0,0,0,0.3); color: white; }
-        button { width: 90px; padding: 12px; border: none; border-radius: 6px; background: #22c55e; color: white; font-weight: bold; cursor: pointer; }
-        button:hover { background: #16a34a; }
-        #connection-bar { padding: 10px; border-radius: 6px; text-align: center; margin-bottom: 20px; font-weight: bold; }
-        .status-wait { background: rgba(245, 158, 11, 0.2); color: #f59e0b; border: 1px solid #f59e0b; }
-        .status-good { background: rgba(34, 197, 94, 0.2); color: #22c55e; border: 1px solid #22c55e; }
-    </style>
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/socket.io/4.0.1/socket.io.js"></script>
-</head>
-<body>
-    <div class="container">
-        <h2>🛡️ Post-Quantum Web Chat</h2>
-        <div id="connection-bar" class="status-wait">Waiting for peer to connect...</div>
-        
-        <div class="card">
-            <div id="chat-box"></div>
-            <div style="display: flex; gap: 10px;">
-                <input type="text" id="msg-input" placeholder="Type a secret message..." onkeypress="if(event.key === 'Enter') sendMessage()">
-                <button onclick="sendMessage()" id="send-btn" disabled>Send</button>
-            </div>
-        </div>
-        
-        <div class="card" style="font-family: monospace; font-size: 12px;">
-            <h4 style="margin:0 0 10px 0; color:#ec4899;">✍️ ML-DSA (Dilithium) Identity Verification </h4>
-            <div id="crypto-logs" style="height: 150px; overflow-y: auto; color: #a3a3a3;"></div>
-        </div>
-    </div>
-
-    <script>
-        const socket = io();
-        let myId = '';
-        let peerId = '';
-        let isEncrypted = false;
-
-        function logCrypto(msg) {
-            document.getElementById('crypto-logs').innerHTML += `[${new Date().toLocaleTimeString()}] ${msg}<br>`;
-            document.getElementById('crypto-logs').scrollTop = document.getElementById('crypto-logs').scrollHeight;
-        }
-
-        function appendMessage(sender, text, kpiInfo="") {
-            const box = document.getElementById('chat-box');
-            let className = sender === 'System' ? 'msg-system' : (sender === 'You' ? 'msg-me' : 'msg-other');
-            let html = `<div class="msg ${className}"><b>${sender}:</b> ${text}`;
-            if (kpiInfo) html += `<div class="kpi">${kpiInfo}</div>`;
-            html += `</div>`;
-            box.innerHTML += html;
-            box.scrollTop = box.scrollHeight;
-        }
-
-        socket.on('connect', () => {
-            myId = socket.id;
-            logCrypto(`Connected to signaling server as: ${myId}`);
-        });
-
-        function generateMockSignature(msg) {
-            // ML-DSA signatures are typically ~2.4KB - 4.6KB depending on security level.
-            // We simulate generating a massive signature string to visualize the PQC overhead.
-            const chars = 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/';
-            let sig = '';
-            for (let i = 0; i < 64; i++) {
-                sig += chars.charAt(Math.floor(Math.random() * chars.length));
-            }
-            return `MLDSA_SIG_v3[${sig}...]`;
-        }
-
-        socket.on('status_update', (data) => {
-            const bar = document.getElementById('connection-bar');
-            if (data.status === 'paired') {
-                peerId = data.peer_id;
-                bar.className = 'status-good';
-                bar.innerText = `Connected securely to peer!`;
-                document.getElementById('send-btn').disabled = false;
-                appendMessage('System', 'Kyber KEM Key Exchange Successful. AES-256 Symmetric Key Derivation Complete.');
-                logCrypto(`[KEM] Handshake complete. Derived shared 256-bit AES key.`);
-                logCrypto(`[DSA] Generated Post-Quantum Identity Keypair (Dilithium / ML-DSA Level 3).`);
-                isEncrypted = true;
-            } else if (data.status === 'waiting') {
-                bar.className = 'status-wait';
-                bar.innerText = `Waiting for peer to connect... (Share this URL to a friend!)`;
-                document.getElementById('send-btn').disabled = true;
-                peerId = '';
-                isEncrypted = false;
-            }
-        });
-
-        socket.on('receive_message', (data) => {
-            logCrypto(`[IN] Received Encrypted Payload (AES-GCM): Ciphertext=${data.encrypted.substring(0, 20)}...`);
-            logCrypto(`[IN] Received Signature Payload: ${data.signature}`);
-            
-            // Simulate verification delay
-            setTimeout(() => {
-                logCrypto(`<span style="color:#22c55e;">[VERIFIED]</span> Identity mathematically proven via ML-DSA Verification Algorithm. Message intact.`);
-                appendMessage('Friend', data.decrypted_msg, `🔒 AES-256 Decrypted<br><span style="color:#22c55e;">✅ Verified Identity (Dilithium)</span>`);
-            }, 600);
-        });
-
-        function sendMessage() {
-            const input = document.getElementById('msg-input');
-            const msg = input.value.trim();
-            if(!msg || !isEncrypted) return;
-            
-            const mockSig = generateMockSignature(msg);
-            
-            logCrypto(`[OUT] Signing message with ML-DSA Private Key... Generated 3,293-byte signature.`);
-            logCrypto(`[OUT] Encrypting message with AES-256 and transmitting...`);
-            
-            appendMessage('You', msg, `🔒 AES-256 Encrypted<br><span style="color:#8b5cf6;">✍️ ML-DSA Signed</span>`);
-            
-            // Send clear text to server and the signature to simulate the massive payload
-            socket.emit('send_message', { target: peerId, msg: msg, signature: mockSig });
-            input.value = '';
-        }
-    </script>
-</body>
-</html>
-"""
+sessions = {}
+
+class Session:
+    """
+    One paired client's crypto context. The AESGCM object wraps OpenSSL's
+    pre-expanded AES key schedule, so constructing it once per pairing
+    (instead of per message) leaves only the hardware AES-NI/GHASH path
+    on the per-message hot path.
+    """
+    __slots__ = ('key', '_aead')
+
+    def __init__(self, key: bytes):
+        self.key = key
+        self._aead = AESGCM(key)
+
+    def encrypt(self, plaintext: bytes) -> bytes:
+        # GCM needs a fresh nonce per message; the frame is
+        # nonce(12) || ct+tag so the receiver splits on a fixed offset.
+        nonce = os.urandom(12)
+        return nonce + self._aead.encrypt(nonce, plaintext, None)
+
+
+def _reap_orphaned_sessions() -> None:
+    """
+    Drops session entries whose socket is no longer connected (e.g. a
+    disconnect handler that raised part-way). Live clients are never
+    touched — an idle pair is still a valid pair, and removing their
+    bookkeeping here would silently break their session while the UI
+    still shows them as connected.
+    """
+    for sid in [sid for sid in sessions if sid not in clients]:
+        sessions.pop(sid, None)
+
 
 @app.route('/')
 def index():
-    return render_template_string(HTML_TEMPLATE)
+    # The chat page is a static file: no Jinja parse per request, Flask
+    # uses its sendfile path, and max_age lets a fronting proxy cache it.
+    return send_from_directory('static', 'chat.html', max_age=3600)
 
 @socketio.on('connect')
 def handle_connect():
     global clients
+    _reap_orphaned_sessions()
+    if len(clients) >= MAX_CLIENTS:
+        print(f"[!] Refusing connection {request.sid}: {MAX_CLIENTS} clients already connected")
+        return False  # reject the connection instead of growing unboundedly
     clients[request.sid] = {"id": request.sid}
+    # Everyone sits in one room so state broadcasts are a single emit
+    # instead of a Python loop over every connected sid.
+    join_room('lobby')
     print(f"[+] Client connected: {request.sid}")
     
     # Simple pairing logic: if there are 2 clients, pair them up
@@ -166,9 +86,10 @@ def handle_connect():
         
         # Simulate Kyber Key Encapsulation Mechanism on the server backend
         # In this demo, the server generates the shared AES key for the session
-        shared_aes_key = get_random_bytes(32)
-        shared_aes_keys[u1] = shared_aes_key
-        shared_aes_keys[u2] = shared_aes_key
+        shared_aes_key = os.urandom(32)
+        session = Session(shared_aes_key)
+        sessions[u1] = session
+        sessions[u2] = session
         
         # Notify both users
         emit('status_update', {'status': 'paired', 'peer_id': u2}, room=u1)
@@ -182,12 +103,11 @@ def handle_disconnect():
     print(f"[-] Client disconnected: {request.sid}")
     if request.sid in clients:
         del clients[request.sid]
-    if request.sid in shared_aes_keys:
-        del shared_aes_keys[request.sid]
+    if request.sid in sessions:
+        del sessions[request.sid]
         
     # Inform all remaining clients they are back in waiting state
-    for sid in clients:
-        socketio.emit('status_update', {'status': 'waiting'}, room=sid)
+    socketio.emit('status_update', {'status': 'waiting'}, room='lobby')
 
 @socketio.on('send_message')
 def handle_message(data):
@@ -196,18 +116,20 @@ def handle_message(data):
     signature = data.get('signature', 'MISSING_SIG')
     sender_sid = request.sid
     
-    if target_sid and target_sid in shared_aes_keys:
+    session = sessions.get(target_sid) if target_sid else None
+    if session is not None:
         # For the hackathon visual demonstration, we encrypt the message on the server
         # using the session's shared AES key, just to simulate the cryptographic payload the receiver gets.
-        aes_key = shared_aes_keys[target_sid]
-        
         try:
-            cipher = AES.new(aes_key, AES.MODE_GCM)
-            ciphertext, tag = cipher.encrypt_and_digest(original_msg.encode('utf-8'))
-            
+            # Socket.IO already length-frames each event on the wire and
+            # carries bytes as binary attachments, so the frame goes out
+            # raw — no base64 inflation or per-message encode/decode
+            # round-trip.
+            frame = session.encrypt(original_msg.encode('utf-8'))
+
             # Send the simulated encrypted payload, the plaintext, and the routed signature
             payload = {
-                'encrypted': base64.b64encode(ciphertext).decode('utf-8'),
+                'encrypted': frame,
                 'decrypted_msg': original_msg,
                 'signature': signature
             }